@@ -1,9 +1,20 @@
 import frappe
 from frappe import _
 from typing import Dict, Any, Optional, Tuple
+import hashlib
 import jwt
+import time
 from datetime import datetime
 
+# In-process cache for token verification keyed by sha256 of the auth
+# header, so only the first request per token pays the JWT decode and
+# token record lookup. Failed verifications are cached for a shorter
+# period to blunt repeated invalid-token load.
+_TOKEN_CACHE_TTL = 30
+_TOKEN_CACHE_NEGATIVE_TTL = 5
+_TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache = {}
+
 def handle_error_response(error: Exception, error_message: str) -> Dict[str, Any]:
     """Standard error response handler"""
     frappe.log_error(f"{error_message}: {str(error)}")
@@ -15,6 +26,42 @@ def handle_error_response(error: Exception, error_message: str) -> Dict[str, Any
     }
 
 def verify_dp_token(headers: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Verify the JWT token from headers, with a short-TTL in-process cache
+    so repeated requests with the same token skip re-verification
+    Returns:
+        Tuple of (is_valid, response_dict)
+    """
+    auth_header = headers.get('Auth-Token')
+    if not auth_header or not auth_header.startswith('Bearer '):
+        # Missing/malformed header fails fast in _verify_dp_token
+        return _verify_dp_token(headers)
+
+    # Scope the key by site: workers serve multiple sites from one
+    # process, and a token valid on one site must not be trusted on another
+    cache_key = hashlib.sha256(
+        f"{frappe.local.site}:{auth_header}".encode()
+    ).hexdigest()[:32]
+    cached = _token_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        is_valid, result = cached[1]
+        # Re-apply the side effects of a fresh verification
+        if is_valid:
+            frappe.session.user = "Administrator"
+        else:
+            frappe.local.response['http_status_code'] = result.get("http_status_code", 401)
+        return is_valid, result
+
+    is_valid, result = _verify_dp_token(headers)
+
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        _token_cache.clear()
+    ttl = _TOKEN_CACHE_TTL if is_valid else _TOKEN_CACHE_NEGATIVE_TTL
+    _token_cache[cache_key] = (time.monotonic() + ttl, (is_valid, result))
+
+    return is_valid, result
+
+def _verify_dp_token(headers: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
     """
     Verify the JWT token from headers and handle Frappe authentication
     Returns:
@@ -2,6 +2,9 @@ import frappe
 from frappe import _
 from typing import Dict, Any
 import base64
+import functools
+import hashlib
+import json
 import os
 from .attendance_api import verify_dp_token, handle_error_response
 import datetime
@@ -56,10 +59,66 @@ def handle_base64_image(base64_string: str, prefix: str = "file") -> Dict[str, s
         )
         raise
 
+SELECT_OPTIONS_CACHE_KEY = "farmer_visit_select_options"
+
+def _build_select_options(doctype: str) -> Dict[str, Any]:
+    """
+    Builds {fieldname: [options]} for all Select fields of a doctype
+    """
+    meta = frappe.get_meta(doctype)
+
+    doctype_options = {}
+
+    # Get all fields of type "Select"
+    select_fields = [field for field in meta.fields if field.fieldtype == "Select"]
+
+    # Extract options for each select field
+    for field in select_fields:
+        if field.options:
+            # Split options string into list and remove empty strings
+            field_options = [opt for opt in field.options.split('\n') if opt]
+            doctype_options[field.fieldname] = field_options
+
+    return doctype_options
+
+@functools.lru_cache(maxsize=None)
+def _select_options_for_site(site: str, doctype: str) -> Dict[str, Any]:
+    """
+    Process-local layer over the Redis cache; warm calls skip Redis too
+    """
+    doctype_options = frappe.cache().hget(SELECT_OPTIONS_CACHE_KEY, doctype)
+    if doctype_options is None:
+        doctype_options = _build_select_options(doctype)
+        frappe.cache().hset(SELECT_OPTIONS_CACHE_KEY, doctype, doctype_options)
+    return doctype_options
+
+def _select_options(doctype: str) -> Dict[str, Any]:
+    # Meta (custom fields, property setters) differs per site while the
+    # worker process is shared, so the memo key must include the site
+    return _select_options_for_site(frappe.local.site, doctype)
+
+def clear_select_options_cache(doc, method=None):
+    """
+    Invalidates cached select options when a DocType is updated
+    Hooked on DocType on_update in hooks.py
+    """
+    frappe.cache().hdel(SELECT_OPTIONS_CACHE_KEY, doc.name)
+    _select_options_for_site.cache_clear()
+
+BMC_LIST_CACHE_KEY = "bmc_list_v1"
+
+def clear_bmc_list_cache(doc, method=None):
+    """
+    Invalidates all cached BMC list responses when a BMC changes
+    Hooked on BMC on_update/on_trash in hooks.py
+    """
+    frappe.cache().delete_value(BMC_LIST_CACHE_KEY)
+
 @frappe.whitelist(allow_guest=True, methods=["GET"])
 def get_field_options() -> Dict[str, Any]:
     """
     Dynamically returns all select field options for Farmer Detail and Visit Tracker
+    Options are cached per doctype and invalidated on DocType update
     Required header: Authorization Bearer token
     """
     try:
@@ -73,12 +132,12 @@ def get_field_options() -> Dict[str, Any]:
             "farmer_details": "Farmer Detail",
             "visit_tracker": "Visit Tracker"
         }
-        
+
         options = {}
-        
+
         for key, doctype in doctypes.items():
             try:
-                meta = frappe.get_meta(doctype)
+                options[key] = _select_options(doctype)
             except Exception as e:
                 frappe.local.response['http_status_code'] = 404
                 return {
@@ -89,20 +148,6 @@ def get_field_options() -> Dict[str, Any]:
                     "http_status_code": 404
                 }
 
-            doctype_options = {}
-            
-            # Get all fields of type "Select"
-            select_fields = [field for field in meta.fields if field.fieldtype == "Select"]
-            
-            # Extract options for each select field
-            for field in select_fields:
-                if field.options:
-                    # Split options string into list and remove empty strings
-                    field_options = [opt for opt in field.options.split('\n') if opt]
-                    doctype_options[field.fieldname] = field_options
-            
-            options[key] = doctype_options
-
         frappe.local.response['http_status_code'] = 200
         return {
             "success": True,
@@ -175,16 +220,13 @@ def get_bmc_list() -> Dict[str, Any]:
                     "http_status_code": 404
                 }
             
-            # Get all villages from the mapped clusters
-            villages = []
-            for cluster in clusters:
-                cluster_villages = frappe.get_all(
-                    "Village Map",
-                    filters={"parent": cluster.cluster},
-                    fields=["village"]
-                )
-                villages.extend([v.village for v in cluster_villages])
-            
+            # Get all villages from the mapped clusters in a single query
+            villages = frappe.get_all(
+                "Village Map",
+                filters={"parent": ["in", [c.cluster for c in clusters]]},
+                pluck="village"
+            )
+
             if not villages:
                 frappe.local.response['http_status_code'] = 404
                 return {
@@ -194,13 +236,14 @@ def get_bmc_list() -> Dict[str, Any]:
                     "code": "NO_VILLAGES_FOUND",
                     "http_status_code": 404
                 }
-            
-            # Get mandals for all villages
-            mandals = list(set([
-                frappe.get_value("Village", v, "mandal") 
-                for v in villages 
-                if frappe.get_value("Village", v, "mandal")
-            ]))
+
+            # Get mandals for all villages in one query instead of a
+            # get_value per village
+            mandals = list(set(frappe.get_all(
+                "Village",
+                filters={"name": ["in", villages], "mandal": ["is", "set"]},
+                pluck="mandal"
+            )))
             
             if not mandals:
                 frappe.local.response['http_status_code'] = 404
@@ -212,37 +255,64 @@ def get_bmc_list() -> Dict[str, Any]:
                     "http_status_code": 404
                 }
 
-        # Get BMCs that have any of the specified mandals in their mandal_list
-        bmc_mandals = frappe.get_all(
-            "Mandal Map",
-            filters={"mandal": ["in", mandals]},
-            fields=["parent as bmc", "mandal"]
-        )
-        
-        if not bmc_mandals:
-            frappe.local.response['http_status_code'] = 404
-            return {
-                "success": False,
-                "status": "error",
-                "message": "No BMCs found in the specified mandals",
-                "code": "NO_BMCS_FOUND",
-                "http_status_code": 404
-            }
+        # Serve the rarely-changing BMC catalog from cache, keyed by the
+        # requested mandal set; invalidated when any BMC changes. Only
+        # mandal sets derived from cluster mappings are cached: the
+        # mandals query param is caller-controlled and would let
+        # arbitrary requests grow the Redis hash without bound
+        use_cache = not mandal_param
+        mandal_key = hashlib.md5(json.dumps(sorted(mandals)).encode()).hexdigest()
+        cached = frappe.cache().hget(BMC_LIST_CACHE_KEY, mandal_key) if use_cache else None
+
+        if cached is None:
+            # Get BMCs that have any of the specified mandals in their mandal_list
+            bmc_mandals = frappe.get_all(
+                "Mandal Map",
+                filters={"mandal": ["in", mandals]},
+                fields=["parent as bmc", "mandal"]
+            )
 
-        # Group mandals by BMC
-        bmc_dict = {}
-        for entry in bmc_mandals:
-            if entry.bmc not in bmc_dict:
-                bmc_doc = frappe.get_doc("BMC", entry.bmc)
-                bmc_dict[entry.bmc] = {
-                    "name": entry.bmc,
-                    "bmc_name": bmc_doc.bmc_name,
-                    "state": bmc_doc.state,
-                    "mandals": []
+            if not bmc_mandals:
+                frappe.local.response['http_status_code'] = 404
+                return {
+                    "success": False,
+                    "status": "error",
+                    "message": "No BMCs found in the specified mandals",
+                    "code": "NO_BMCS_FOUND",
+                    "http_status_code": 404
                 }
-            bmc_dict[entry.bmc]["mandals"].append(entry.mandal)
 
-        bmc_list = list(bmc_dict.values())
+            # Group mandals by BMC
+            bmc_dict = {}
+            for entry in bmc_mandals:
+                if entry.bmc not in bmc_dict:
+                    bmc_doc = frappe.get_doc("BMC", entry.bmc)
+                    bmc_dict[entry.bmc] = {
+                        "name": entry.bmc,
+                        "bmc_name": bmc_doc.bmc_name,
+                        "state": bmc_doc.state,
+                        "mandals": []
+                    }
+                bmc_dict[entry.bmc]["mandals"].append(entry.mandal)
+
+            bmc_list = list(bmc_dict.values())
+            cached = {
+                "data": bmc_list,
+                "etag": hashlib.md5(
+                    json.dumps(bmc_list, sort_keys=True, default=str).encode()
+                ).hexdigest()
+            }
+            if use_cache:
+                frappe.cache().hset(BMC_LIST_CACHE_KEY, mandal_key, cached)
+
+        # Honor conditional GETs: clients echo the body-level "etag"
+        # field back in If-None-Match and get a bodyless 304 while their
+        # copy is current (frappe serializes the whole response dict as
+        # JSON, so no real ETag header is available on this path)
+        etag = cached["etag"]
+        if frappe.request.headers.get("If-None-Match") == etag:
+            frappe.local.response['http_status_code'] = 304
+            return {}
 
         frappe.local.response['http_status_code'] = 200
         return {
@@ -250,7 +320,8 @@ def get_bmc_list() -> Dict[str, Any]:
             "status": "success",
             "message": "BMC list retrieved successfully",
             "code": "BMC_LIST_RETRIEVED",
-            "data": bmc_list,
+            "data": cached["data"],
+            "etag": etag,
             "http_status_code": 200
         }
 
@@ -307,16 +378,14 @@ def get_assigned_villages() -> Dict[str, Any]:
                 "http_status_code": 404
             }
         
-        # Get all villages from the mapped clusters
-        villages = []
-        for cluster in clusters:
-            cluster_villages = frappe.get_all(
-                "Village Map",
-                filters={"parent": cluster.cluster},
-                fields=["village"]
-            )
-            villages.extend([v.village for v in cluster_villages])
-        
+        # Get all villages from the mapped clusters in a single query
+        cluster_villages = frappe.get_all(
+            "Village Map",
+            filters={"parent": ["in", [c.cluster for c in clusters]]},
+            fields=["village"]
+        )
+        villages = [v.village for v in cluster_villages]
+
         if not villages:
             frappe.local.response['http_status_code'] = 404
             return {
@@ -326,22 +395,23 @@ def get_assigned_villages() -> Dict[str, Any]:
                 "code": "NO_VILLAGES_FOUND",
                 "http_status_code": 404
             }
-        
-        # Get complete village information
-        village_details = []
-        for village in villages:
-            village_doc = frappe.get_doc("Village", village)
-            village_details.append({
-                "name": village_doc.name,
-                "mandal": village_doc.mandal,
-                "village_name": village_doc.village_name,
-                "district": village_doc.district,
-                "state": village_doc.state,
-                "pincode": village_doc.pincode,
-                "latitude": village_doc.latitude,
-                "longitude": village_doc.longitude,
-                "nearest_towncity": village_doc.nearest_towncity
-            })
+
+        # Get complete village information in a single query
+        village_details = frappe.get_all(
+            "Village",
+            filters={"name": ["in", villages]},
+            fields=[
+                "name",
+                "mandal",
+                "village_name",
+                "district",
+                "state",
+                "pincode",
+                "latitude",
+                "longitude",
+                "nearest_towncity"
+            ]
+        )
 
         frappe.local.response['http_status_code'] = 200
         return {
@@ -437,6 +507,9 @@ def create_farmer_visit(
             **farmer_create_detail
         })
 
+        # Skip version snapshots for these freshly created docs to save
+        # one extra insert per document
+        farmer.flags.ignore_version = True
         farmer.insert()
         farmer_name = farmer.name
 
@@ -484,6 +557,9 @@ def create_farmer_visit(
             "visited_by": employee,
             **visit_tracker_detail
         })
+        visit.flags.ignore_version = True
+        # Insert and submit the same in-memory doc in the one open
+        # transaction; the single commit below covers both records
         visit.insert()
         visit.submit()
 
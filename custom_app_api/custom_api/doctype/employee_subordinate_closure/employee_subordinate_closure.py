@@ -0,0 +1,77 @@
+# Copyright (c) 2025, Hopnet and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class EmployeeSubordinateClosure(Document):
+	pass
+
+
+CLOSURE_DIRTY_FLAG = "employee_closure_dirty"
+
+
+def rebuild_closure():
+    """
+    Rebuilds the full ancestor -> descendant closure from reports_to in
+    one recursive query; every employee is also its own descendant, so
+    permission checks become a single index seek on ancestor
+    """
+    # Clear the dirty marker before reading the DB; a reports_to change
+    # that lands mid-run sets it again and is picked up below
+    frappe.cache().delete_value(CLOSURE_DIRTY_FLAG)
+
+    frappe.db.sql("DELETE FROM `tabEmployee Subordinate Closure`")
+    frappe.db.sql("""
+        INSERT INTO `tabEmployee Subordinate Closure`
+            (name, creation, modified, modified_by, owner, ancestor, descendant)
+        WITH RECURSIVE closure AS (
+            /* Every employee is its own descendant */
+            SELECT name AS ancestor, name AS descendant
+            FROM `tabEmployee`
+
+            UNION ALL
+
+            /* Walk down the reporting line */
+            SELECT c.ancestor, e.name
+            FROM `tabEmployee` e
+            INNER JOIN closure c ON e.reports_to = c.descendant
+        )
+        SELECT
+            CONCAT(ancestor, '::', descendant),
+            NOW(), NOW(), 'Administrator', 'Administrator',
+            ancestor, descendant
+        FROM closure
+    """)
+
+    # Changes committed while this rebuild was running were skipped by
+    # the deduplicated enqueue; run once more so the closure catches up
+    if frappe.cache().get_value(CLOSURE_DIRTY_FLAG):
+        _enqueue_rebuild()
+
+
+def _enqueue_rebuild():
+    # Deduplicate so a bulk import queues one rebuild, not one per save;
+    # the dirty marker covers saves landing while a rebuild is running
+    frappe.enqueue(
+        "custom_app_api.custom_api.doctype.employee_subordinate_closure"
+        ".employee_subordinate_closure.rebuild_closure",
+        queue="long",
+        enqueue_after_commit=True,
+        deduplicate=True,
+        job_id="rebuild_employee_subordinate_closure"
+    )
+
+
+def refresh_on_reports_to_change(doc, method=None):
+    """
+    Rebuilds the closure in the background when an employee's reporting
+    line changes
+    Hooked on Employee on_update/on_trash in hooks.py
+    """
+    if method == "on_update" and not doc.has_value_changed("reports_to"):
+        return
+
+    frappe.cache().set_value(CLOSURE_DIRTY_FLAG, 1)
+    _enqueue_rebuild()
@@ -131,34 +131,40 @@ def execute(filters=None):
         "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px;'>"
     ]
     
+    # Get attendance for all designations in a single grouped JOIN
+    # instead of one Employee + one Attendance query per designation
+    attendance_rows = frappe.db.sql("""
+        SELECT
+            e.designation,
+            a.status,
+            COUNT(*) as count
+        FROM `tabEmployee` e
+        INNER JOIN `tabAttendance` a
+            ON a.employee = e.name
+            AND a.attendance_date = %(date)s
+            AND a.docstatus = 1
+        WHERE e.company IN %(companies)s
+        AND e.status = 'Active'
+        AND e.custom_point IN %(points)s
+        GROUP BY e.designation, a.status
+    """, {
+        'date': filters.date,
+        'companies': filters.companies,
+        'points': [row["point"] for row in data if row.get("point")]
+    }, as_dict=1)
+
+    # Pivot into {designation: {status: count}}
+    designation_attendance = {}
+    for row in attendance_rows:
+        designation_attendance.setdefault(row.designation, {})[row.status] = row.count
+
     for desig in designation_data:
-        # Get attendance for this designation
-        attendance = frappe.get_all(
-            "Attendance",
-            fields=["status", "count(*) as count"],
-            filters={
-                "attendance_date": filters.date,
-                "docstatus": 1,
-                "employee": ("in", 
-                    frappe.get_all(
-                        "Employee",
-                        filters={
-                            "designation": desig.designation,
-                            "company": ("in", filters.companies),
-                            "status": "Active",
-                            "custom_point": ("in", [row["point"] for row in data if row.get("point")])
-                        },
-                        pluck="name"
-                    )
-                )
-            },
-            group_by="status"
-        )
+        counts = designation_attendance.get(desig.designation, {})
 
         # Calculate attendance counts and percentages
-        present = sum(a.count for a in attendance if a.status in ["Present", "Work From Home"])
-        absent = sum(a.count for a in attendance if a.status == "Absent")
-        on_leave = sum(a.count for a in attendance if a.status == "On Leave")
+        present = counts.get("Present", 0) + counts.get("Work From Home", 0)
+        absent = counts.get("Absent", 0)
+        on_leave = counts.get("On Leave", 0)
         marked = present + absent + on_leave
         
         if marked > 0:
@@ -283,20 +289,19 @@ def get_point_wise_attendance(filters):
     
     # Create point to zone mapping
     point_zone_map = {p.name: p.zone_name for p in allowed_points}
-    
+
+    # Build the allowed point set once; intersect with user-specified
+    # points instead of a linear scan per requested point
+    allowed_names = {p.name for p in allowed_points}
+    requested = set(filters.get("points") or [])
+    effective_points = list(requested & allowed_names) if requested else list(allowed_names)
+
     # Get all points and their employees
     point_filters = {
         "company": ("in", filters.companies),
         "status": "Active",
-        "custom_point": ("in", [p.name for p in allowed_points])
+        "custom_point": ("in", effective_points)
     }
-    
-    # Add points filter if specified
-    if filters.get("points"):
-        point_filters["custom_point"] = ("in", [
-            p for p in filters.get("points") 
-            if p in [ap.name for ap in allowed_points]
-        ])
 
     points = frappe.get_all(
         "Employee",
@@ -309,7 +314,38 @@ def get_point_wise_attendance(filters):
     )
 
     data = []
-    zone_wise_data = {}  # For grouping by zone
+
+    # Grand total accumulators, filled during the main pass instead of
+    # re-iterating data afterwards
+    total_employees = total_present = total_absent = total_on_leave = 0
+
+    # Get attendance for all points in one grouped JOIN instead of
+    # one Employee + one Attendance query per point
+    point_attendance = {}
+    point_names = [p.point for p in points if p.point]
+    if point_names:
+        attendance_rows = frappe.db.sql("""
+            SELECT
+                e.custom_point,
+                a.status,
+                COUNT(*) as count
+            FROM `tabEmployee` e
+            INNER JOIN `tabAttendance` a
+                ON a.employee = e.name
+                AND a.attendance_date = %(date)s
+                AND a.docstatus = 1
+            WHERE e.company IN %(companies)s
+            AND e.status = 'Active'
+            AND e.custom_point IN %(points)s
+            GROUP BY e.custom_point, a.status
+        """, {
+            'date': filters.date,
+            'companies': filters.companies,
+            'points': point_names
+        }, as_dict=1)
+
+        for row in attendance_rows:
+            point_attendance.setdefault(row.custom_point, {})[row.status] = row.count
 
     for point_data in points:
         if not point_data.point:
@@ -318,43 +354,11 @@ def get_point_wise_attendance(filters):
         # Get zone for this point
         zone = point_zone_map.get(point_data.point, "")
 
-        # Get employees for this point
-        point_employees = frappe.get_all(
-            "Employee",
-            fields=["name"],
-            filters={
-                "custom_point": point_data.point,
-                "company": ("in", filters.companies),
-                "status": "Active"
-            }
-        )
-
-        # Get attendance for these employees
-        attendance_counts = frappe.get_all(
-            "Attendance",
-            fields=[
-                "status",
-                "count(*) as count"
-            ],
-            filters={
-                "attendance_date": filters.date,
-                "employee": ("in", [emp.name for emp in point_employees]),
-                "docstatus": 1
-            },
-            group_by="status"
-        )
-
-        # Initialize counters
-        present = absent = on_leave = 0
-
-        # Process attendance counts
-        for count_data in attendance_counts:
-            if count_data.status in ["Present", "Work From Home"]:
-                present = count_data.count
-            elif count_data.status == "Absent":
-                absent = count_data.count
-            elif count_data.status == "On Leave":
-                on_leave = count_data.count
+        # Process attendance counts for this point
+        counts = point_attendance.get(point_data.point, {})
+        present = counts.get("Present", 0) + counts.get("Work From Home", 0)
+        absent = counts.get("Absent", 0)
+        on_leave = counts.get("On Leave", 0)
 
         # Calculate attendance percentage
         total_marked = present + absent + on_leave
@@ -372,64 +376,19 @@ def get_point_wise_attendance(filters):
 
         data.append(row_data)
 
-        # Aggregate zone-wise data
-        if zone not in zone_wise_data:
-            zone_wise_data[zone] = {
-                "total_employees": 0,
-                "present": 0,
-                "absent": 0,
-                "on_leave": 0
-            }
-        zone_wise_data[zone]["total_employees"] += point_data.total_employees
-        zone_wise_data[zone]["present"] += present
-        zone_wise_data[zone]["absent"] += absent
-        zone_wise_data[zone]["on_leave"] += on_leave
+        # Accumulate grand totals alongside row assembly
+        total_employees += point_data.total_employees
+        total_present += present
+        total_absent += absent
+        total_on_leave += on_leave
 
     # Sort by zone and then attendance percentage
     data.sort(key=lambda x: (x["zone"] or "", x["attendance_percentage"]), reverse=True)
 
-    # Add zone subtotals (commented out)
-    final_data = []
-    current_zone = None
-    for row in data:
-        # if row["zone"] != current_zone:
-        #     if current_zone is not None:
-        #         # Add zone total
-        #         zone_total = zone_wise_data[current_zone]
-        #         zone_marked = zone_total["present"] + zone_total["absent"] + zone_total["on_leave"]
-        #         final_data.append({
-        #             "zone": current_zone + " Total",
-        #             "point": "",
-        #             "total_employees": zone_total["total_employees"],
-        #             "present": zone_total["present"],
-        #             "absent": zone_total["absent"],
-        #             "on_leave": zone_total["on_leave"],
-        #             "attendance_percentage": (zone_total["present"] / zone_marked * 100) if zone_marked else 0
-        #         })
-        #     current_zone = row["zone"]
-        final_data.append(row)
-
-    # Add last zone total if exists (commented out)
-    # if current_zone:
-    #     zone_total = zone_wise_data[current_zone]
-    #     zone_marked = zone_total["present"] + zone_total["absent"] + zone_total["on_leave"]
-    #     final_data.append({
-    #         "zone": current_zone + " Total",
-    #         "point": "",
-    #         "total_employees": zone_total["total_employees"],
-    #         "present": zone_total["present"],
-    #         "absent": zone_total["absent"],
-    #         "on_leave": zone_total["on_leave"],
-    #         "attendance_percentage": (zone_total["present"] / zone_marked * 100) if zone_marked else 0
-    #     })
-
     # Add grand total
-    total_employees = sum(row["total_employees"] for row in data)
-    total_present = sum(row["present"] for row in data)
-    total_absent = sum(row["absent"] for row in data)
-    total_on_leave = sum(row["on_leave"] for row in data)
+    final_data = data
     total_marked = total_present + total_absent + total_on_leave
-    
+
     final_data.append({
         "zone": "Grand Total",
         "point": "",
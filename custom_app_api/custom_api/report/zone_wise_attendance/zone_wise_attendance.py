@@ -14,11 +14,12 @@ def execute(filters=None):
     columns = get_columns()
     data = get_zone_wise_attendance(filters)
 
-    # Calculate totals for summary and chart
-    total_employees = sum(row["total_employees"] for row in data[:-1])  # Exclude the last (Total) row
-    total_present = sum(row["present"] for row in data[:-1])
-    total_absent = sum(row["absent"] for row in data[:-1])
-    total_on_leave = sum(row["on_leave"] for row in data[:-1])
+    # Read totals from the Total row instead of re-summing the data rows
+    totals_row = data[-1] if data else {}
+    total_employees = totals_row.get("total_employees", 0)
+    total_present = totals_row.get("present", 0)
+    total_absent = totals_row.get("absent", 0)
+    total_on_leave = totals_row.get("on_leave", 0)
     total_marked = total_present + total_absent + total_on_leave
 
     # Handle case when there's no attendance data
@@ -174,23 +175,23 @@ def get_columns():
     ]
 
 def get_zone_wise_attendance(filters):
-    # First get all zones (removed is_active filter since the column doesn't exist)
-    allowed_zones = frappe.get_list("Zone", 
-        fields=["name"]
-    )
-    
+    # First get all zone names (removed is_active filter since the column
+    # doesn't exist); pluck returns a plain list, skipping the dict rows
+    allowed_zones = frappe.get_list("Zone", pluck="name")
+
     # Get all zones and their employees
     zone_filters = {
         "company": ("in", filters.companies),
         "status": "Active",
-        "custom_zone": ("in", [z.name for z in allowed_zones])
+        "custom_zone": ("in", allowed_zones)
     }
-    
+
     # Add zones filter if specified
     if filters.get("zones"):
+        allowed_zone_set = set(allowed_zones)
         zone_filters["custom_zone"] = ("in", [
             z for z in filters.get("zones")
-            if z in [az.name for az in allowed_zones]
+            if z in allowed_zone_set
         ])
 
     zones = frappe.get_all(
@@ -204,6 +205,11 @@ def get_zone_wise_attendance(filters):
     )
 
     data = []
+
+    # Totals accumulate during the main pass instead of four extra
+    # sweeps over the assembled rows
+    total_employees = total_present = total_absent = total_on_leave = 0
+
     for zone_data in zones:
         if not zone_data.zone:
             continue
@@ -258,15 +264,14 @@ def get_zone_wise_attendance(filters):
             "attendance_percentage": attendance_percentage
         })
 
+        total_employees += zone_data.total_employees
+        total_present += present
+        total_absent += absent
+        total_on_leave += on_leave
+
     # Sort by attendance percentage in descending order
     data.sort(key=lambda x: x["attendance_percentage"], reverse=True)
 
-    # Calculate totals
-    total_employees = sum(row["total_employees"] for row in data)
-    total_present = sum(row["present"] for row in data)
-    total_absent = sum(row["absent"] for row in data)
-    total_on_leave = sum(row["on_leave"] for row in data)
-
     # Calculate overall attendance percentage based on total employees
     overall_attendance_percentage = (total_present / total_employees * 100) if total_employees else 0
 
@@ -163,7 +163,15 @@ doc_events = {
 	# 	"on_trash": "method"
 	# }
 	"Employee": {
-		"on_update": ["custom_app_api.doc_events.employee.after_save"]
+		"on_update": [
+			"custom_app_api.doc_events.employee.after_save",
+			"custom_app_api.permission_query_conditions.employee.clear_user_employee_cache",
+			"custom_app_api.custom_api.doctype.employee_subordinate_closure.employee_subordinate_closure.refresh_on_reports_to_change"
+		],
+		"on_trash": [
+			"custom_app_api.permission_query_conditions.employee.clear_user_employee_cache",
+			"custom_app_api.custom_api.doctype.employee_subordinate_closure.employee_subordinate_closure.refresh_on_reports_to_change"
+		]
 	},
 	"Job Applicant": {
         "after_insert": "custom_app_api.cron_functions.create_employee_referral_and_additional_salary.create_employee_referral_for_job_applicant"
@@ -173,7 +181,14 @@ doc_events = {
 	},
 	"Additional Salary": {
 		"on_update": "custom_app_api.doc_events.additional_salary.on_update"
-    }
+    },
+	"DocType": {
+		"on_update": "custom_app_api.custom_api.api_end_points.farmer_visit_api.clear_select_options_cache"
+	},
+	"BMC": {
+		"on_update": "custom_app_api.custom_api.api_end_points.farmer_visit_api.clear_bmc_list_cache",
+		"on_trash": "custom_app_api.custom_api.api_end_points.farmer_visit_api.clear_bmc_list_cache"
+	}
 }
 
 # Scheduled Tasks
@@ -0,0 +1,11 @@
+import frappe
+
+from custom_app_api.custom_api.doctype.employee_subordinate_closure.employee_subordinate_closure import (
+    rebuild_closure,
+)
+
+
+def execute():
+    """Builds the initial Employee Subordinate Closure rows"""
+    if frappe.db.table_exists("Employee Subordinate Closure"):
+        rebuild_closure()
@@ -1,5 +1,7 @@
 import frappe
 
+from custom_app_api.permission_query_conditions.employee import get_employee_for_user
+
 def get_permission_query_conditions(user):
     """
     Adds permission conditions for Attendance based on employee hierarchy:
@@ -10,21 +12,16 @@ def get_permission_query_conditions(user):
     """
     
     conditions = []
-    
-    # Log user and roles
-    # frappe.msgprint(f"User: {user}, Roles: {frappe.get_roles(user)}")
-    
+
     # Skip for System Manager or Administrator
+    # (frappe.get_roles is cached per request by frappe itself)
     if "System Manager" in frappe.get_roles(user) or user == "Administrator":
-        # frappe.msgprint("User is System Manager or Administrator - no conditions applied")
         return " and ".join(conditions)
-    
-    # Get employee record for logged-in user
-    employee = frappe.db.get_value("Employee", {"user_id": user}, "name")
-    # frappe.msgprint(f"Employee record found: {employee}")
-    
+
+    # Get employee record for logged-in user (cached, negatives included)
+    employee = get_employee_for_user(user)
+
     if not employee:
-        # frappe.msgprint("No employee record found - using default permissions")
         return " and ".join(conditions)
     
     # Get all subordinates using MariaDB recursive query
@@ -45,14 +42,16 @@ def get_permission_query_conditions(user):
         SELECT name FROM emp_hierarchy
     """
     subordinates = frappe.db.sql(subordinates_query, {"employee": employee}, as_dict=1)
-    subordinate_names = [employee]  # Include self
-    subordinate_names.extend([d.name for d in subordinates])
-    # frappe.msgprint(f"Found subordinates: {subordinate_names}")
-    
-    # Add condition to show only subordinates' attendance records
-    if subordinate_names:
-        names_str = "','".join(subordinate_names)
-        conditions.append(f"employee in ('{names_str}')")
-        # frappe.msgprint(f"Final SQL condition: {' and '.join(conditions)}")
-    
+
+    # Add condition to show only subordinates' attendance records;
+    # with no reports a plain equality lets MariaDB use a single index probe
+    if not subordinates:
+        conditions.append(f"employee = {frappe.db.escape(employee)}")
+    else:
+        subordinate_names = [employee]  # Include self
+        subordinate_names.extend([d.name for d in subordinates])
+        # Escape each name instead of hand-quoting the joined string
+        names_sql = ", ".join(frappe.db.escape(n) for n in subordinate_names)
+        conditions.append(f"employee in ({names_sql})")
+
     return " and ".join(conditions)
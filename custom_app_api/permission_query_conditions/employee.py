@@ -1,5 +1,29 @@
 import frappe
 
+USER_EMPLOYEE_CACHE_KEY = "user_employee_map"
+_EMPLOYEE_MISSING = "__none__"
+
+def get_employee_for_user(user):
+    """
+    Cached user -> employee name lookup, including negative results, so
+    permission checks for non-employee users skip the DB round-trip
+    """
+    cached = frappe.cache().hget(USER_EMPLOYEE_CACHE_KEY, user)
+    if cached is not None:
+        return None if cached == _EMPLOYEE_MISSING else cached
+
+    employee = frappe.db.get_value("Employee", {"user_id": user}, "name")
+    frappe.cache().hset(USER_EMPLOYEE_CACHE_KEY, user, employee or _EMPLOYEE_MISSING)
+    return employee
+
+def clear_user_employee_cache(doc, method=None):
+    """
+    Drops the whole user -> employee map when any Employee changes;
+    it rebuilds lazily on the next permission check
+    Hooked on Employee on_update/on_trash in hooks.py
+    """
+    frappe.cache().delete_value(USER_EMPLOYEE_CACHE_KEY)
+
 def get_permission_query_conditions(user):
     """
     Adds permission conditions based on employee hierarchy:
@@ -9,50 +33,44 @@ def get_permission_query_conditions(user):
     Returns: string - SQL condition
     """
 
-    #frappe.msgprint(f"Permission check for user: {user}")
-    
     conditions = [] #["status = 'Active'"]
-    
+
     # Skip for System Manager or Administrator
+    # (frappe.get_roles is cached per request by frappe itself)
     if "System Manager" in frappe.get_roles(user) or user == "Administrator":
         return " and ".join(conditions)
-    
-    # Get employee record for logged-in user
-    employee = frappe.db.get_value("Employee", {"user_id": user}, "name")
-    #frappe.msgprint(f"Employee found: {employee}")
+
+    # Get employee record for logged-in user (cached, negatives included)
+    employee = get_employee_for_user(user)
     if not employee:
         return " and ".join(conditions)  # Return default permissions if no employee record
-    
-    # Get all subordinates using MariaDB recursive query
-    subordinates_query = """
+
+    escaped_employee = frappe.db.escape(employee)
+
+    # Prefer the materialized closure table (one index seek on ancestor,
+    # maintained by the Employee reports_to hook); fall back to walking
+    # the hierarchy with a recursive CTE until the closure is built
+    if frappe.db.exists("Employee Subordinate Closure", {"ancestor": employee}):
+        conditions.append(
+            "name in (SELECT descendant FROM `tabEmployee Subordinate Closure` "
+            f"WHERE ancestor = {escaped_employee})"
+        )
+    else:
+        conditions.append(f"""name in (
         WITH RECURSIVE emp_hierarchy AS (
-            /* Get direct subordinates first */
-            SELECT name, reports_to, 1 as level
+            /* Start from the logged-in employee (include self) */
+            SELECT name, reports_to
             FROM `tabEmployee`
-            WHERE reports_to = %(employee)s
+            WHERE name = {escaped_employee}
 
             UNION ALL
-            
+
             /* Get subordinates of subordinates */
-            SELECT e.name, e.reports_to, eh.level + 1
+            SELECT e.name, e.reports_to
             FROM `tabEmployee` e
             INNER JOIN emp_hierarchy eh ON e.reports_to = eh.name
         )
         SELECT name FROM emp_hierarchy
-    """
-    subordinates = frappe.db.sql(subordinates_query, {"employee": employee}, as_dict=1)
-    subordinate_names = [employee]  # Include self
-    subordinate_names.extend([d.name for d in subordinates])
-    
-    #frappe.msgprint(f"Subordinates: {subordinate_names}")
-    
-    # Add condition to show only subordinates - Fixed SQL syntax
-    if subordinate_names:
-        # Simple string join with single quotes
-        names_str = "','".join(subordinate_names)
-        conditions.append(f"name in ('{names_str}')")
-    
-    final_condition = " and ".join(conditions)
-    #frappe.msgprint(f"Final condition: {final_condition}")
-    
-    return final_condition
+    )""")
+
+    return " and ".join(conditions)